@@ -0,0 +1,233 @@
+import pandas as pd
+from typing import Dict, Any, List, Optional
+import os
+
+LEAD_BINS = [0, 7, 30, 90, 365, 737]
+LEAD_LABELS = ['0-7d', '7-30d', '30-90d', '90-365d', '365d+']
+
+
+class AnalyticsBackend:
+    """Compute the pipeline analytics dict from a bookings CSV/Parquet file.
+
+    Backends that hold the data in memory expose it as `raw_data` (cleaned)
+    and `processed_data` (with derived features) after `compute()`.
+    """
+    name = None
+    raw_data = None
+    processed_data = None
+
+    def __init__(self, data_path: str, month_order: List[str]):
+        self.data_path = data_path
+        self.month_order = month_order
+
+    def compute(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
+
+class PandasBackend(AnalyticsBackend):
+    """Reference backend that loads the whole file and processes it eagerly"""
+    name = "pandas"
+
+    MEAL_MAP = {
+        'BB': "Breakfast",
+        'FB': "Full Board",
+        'HB': "Half Board",
+        'SC': "No meal",
+        'Undefined': "No meal"
+    }
+
+    def compute(self) -> Dict[str, Any]:
+        if os.path.splitext(self.data_path)[1].lower() == '.parquet':
+            self.raw_data = pd.read_parquet(self.data_path)
+        else:
+            self.raw_data = pd.read_csv(self.data_path)
+        self._handle_missing_data()
+        self._transform_features()
+        self._calculate_derived_features()
+        return self._generate_analytics(self.processed_data)
+
+    def _handle_missing_data(self) -> None:
+        """Clean and impute missing values"""
+        self.raw_data['agent'] = self.raw_data['agent'].fillna(0)
+        self.raw_data['company'] = self.raw_data['company'].fillna(0)
+        self.raw_data = self.raw_data.dropna(subset=['children'])
+        self.raw_data['country'] = self.raw_data['country'].fillna('Unknown')
+
+    def _transform_features(self) -> None:
+        """Convert and enrich raw features"""
+        self.raw_data["meal"] = self.raw_data["meal"].replace(self.MEAL_MAP).astype('category')
+
+        # Create proper datetime field
+        self.raw_data['arrival_date'] = pd.to_datetime(
+            self.raw_data['arrival_date_year'].astype(str) + '-' +
+            self.raw_data['arrival_date_month'] + '-' +
+            self.raw_data['arrival_date_day_of_month'].astype(str))
+
+        self.raw_data['reservation_status_date'] = pd.to_datetime(
+            self.raw_data['reservation_status_date']
+        )
+
+    def _calculate_derived_features(self) -> None:
+        """Create new calculated features"""
+        df = self.raw_data
+        df['total_guests'] = df['adults'] + df['children']
+        df['total_nights'] = df['stays_in_weekend_nights'] + df['stays_in_week_nights']
+        df['total_revenue'] = df['adr'] * df['total_nights']
+        self.processed_data = df[df['total_guests'] > 0]
+
+    def _generate_analytics(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """Precompute key analytics"""
+        lead_time_group = pd.cut(df['lead_time'], bins=LEAD_BINS, labels=LEAD_LABELS)
+
+        # Stable sorts keep ties in country order so backends agree
+        return {
+            'summary_stats': {
+                'total_bookings': len(df),
+                'cancellation_rate': df['is_canceled'].mean(),
+                'avg_lead_time': df['lead_time'].mean()
+            },
+            'monthly_metrics': self._monthly_adr_analysis(df),
+            'cancellation_analysis': {
+                'by_country': df.groupby('country')['is_canceled'].mean().sort_values(ascending=False, kind='stable').head(10).to_dict(),
+                'by_lead_time': df.groupby(lead_time_group, observed=False)['is_canceled'].mean().to_dict()
+            },
+            'top_countries': df.groupby('country').size().sort_values(ascending=False, kind='stable').head(10).to_dict(),
+            'guest_distribution': df['total_guests'].value_counts().sort_index().to_dict()
+        }
+
+    def _monthly_adr_analysis(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """Analyze monthly metrics"""
+        monthly = df.groupby('arrival_date_month')['adr'].mean().reset_index()
+        monthly['arrival_date_month'] = pd.Categorical(
+            monthly['arrival_date_month'],
+            categories=self.month_order,
+            ordered=True
+        )
+        return {
+            'monthly_adr': monthly.sort_values('arrival_date_month').set_index('arrival_date_month')['adr'].to_dict(),
+            'monthly_revenue': df.groupby('arrival_date_month')['total_revenue'].sum().to_dict()
+        }
+
+
+class DuckDBBackend(AnalyticsBackend):
+    """Lazy, multi-threaded backend that queries the CSV/Parquet file in place.
+
+    Cleaning and derived features are expressed in SQL so DuckDB pushes the
+    column projection and filters into the file scan, and every aggregate is
+    computed in a single pass with GROUPING SETS. Set `memory_limit` (e.g.
+    "2GB") to let DuckDB spill to disk instead of holding the data in RAM.
+    """
+    name = "duckdb"
+
+    # Match pandas' default NA markers used by the hotel bookings CSV
+    NULL_STRINGS = ['', 'NA', 'NULL', 'N/A', 'NaN', 'nan', 'null']
+
+    def __init__(self, data_path: str, month_order: List[str],
+                 threads: Optional[int] = None, memory_limit: Optional[str] = None):
+        super().__init__(data_path, month_order)
+        import duckdb
+
+        self.con = duckdb.connect()
+        if threads:
+            self.con.execute(f"SET threads = {int(threads)}")
+        if memory_limit:
+            memory_limit = str(memory_limit).replace("'", "''")
+            self.con.execute(f"SET memory_limit = '{memory_limit}'")
+
+    def _source(self) -> str:
+        path = self.data_path.replace("'", "''")
+        if os.path.splitext(path)[1].lower() == '.parquet':
+            return f"read_parquet('{path}')"
+        null_strings = ", ".join(f"'{s}'" for s in self.NULL_STRINGS)
+        return (
+            f"read_csv('{path}', header = true, nullstr = [{null_strings}], "
+            f"types = {{'children': 'DOUBLE', 'adr': 'DOUBLE', 'country': 'VARCHAR'}})"
+        )
+
+    def _query(self) -> str:
+        lead_cases = "\n".join(
+            f"                WHEN lead_time > {low} AND lead_time <= {high} THEN '{label}'"
+            for low, high, label in zip(LEAD_BINS, LEAD_BINS[1:], LEAD_LABELS)
+        )
+        return f"""
+        WITH bookings AS (
+            SELECT
+                is_canceled,
+                lead_time,
+                adr,
+                arrival_date_month,
+                COALESCE(country, 'Unknown') AS country,
+                adults + children AS total_guests,
+                adr * (stays_in_weekend_nights + stays_in_week_nights) AS total_revenue,
+                CASE
+{lead_cases}
+                END AS lead_time_group
+            FROM {self._source()}
+            WHERE children IS NOT NULL AND adults + children > 0
+        )
+        SELECT
+            GROUPING(country) = 0 AS by_country,
+            GROUPING(arrival_date_month) = 0 AS by_month,
+            GROUPING(lead_time_group) = 0 AS by_lead_time,
+            GROUPING(total_guests) = 0 AS by_guests,
+            country, arrival_date_month, lead_time_group, total_guests,
+            COUNT(*) AS bookings,
+            AVG(is_canceled) AS cancellation_rate,
+            AVG(lead_time) AS avg_lead_time,
+            AVG(adr) AS adr,
+            SUM(total_revenue) AS revenue
+        FROM bookings
+        GROUP BY GROUPING SETS (
+            (), (country), (arrival_date_month), (lead_time_group), (total_guests)
+        )
+        """
+
+    def compute(self) -> Dict[str, Any]:
+        rows = self.con.execute(self._query()).fetchall()
+
+        summary, countries, months, lead_times, guests = None, [], [], {}, {}
+        for (by_country, by_month, by_lead_time, by_guests, country, month,
+             lead_group, total_guests, bookings, cancel_rate, lead_time, adr, revenue) in rows:
+            if by_country:
+                countries.append((country, bookings, cancel_rate))
+            elif by_month:
+                # groupby drops NaN keys, so skip NULL group keys too
+                if month is not None:
+                    months.append((month, adr, revenue))
+            elif by_lead_time:
+                # pd.cut leaves out-of-range lead times as NaN, which groupby drops
+                if lead_group is not None:
+                    lead_times[lead_group] = cancel_rate
+            elif by_guests:
+                if total_guests is not None:
+                    guests[total_guests] = bookings
+            else:
+                summary = (bookings, cancel_rate, lead_time)
+
+        month_rank = {month: i for i, month in enumerate(self.month_order)}
+        by_rate = sorted(countries, key=lambda c: (-c[2], c[0]))[:10]
+        by_count = sorted(countries, key=lambda c: (-c[1], c[0]))[:10]
+
+        return {
+            'summary_stats': {
+                'total_bookings': summary[0],
+                'cancellation_rate': summary[1],
+                'avg_lead_time': summary[2]
+            },
+            'monthly_metrics': {
+                'monthly_adr': {m: a for m, a, _ in sorted(months, key=lambda m: month_rank.get(m[0], len(month_rank)))},
+                'monthly_revenue': {m: r for m, _, r in sorted(months)}
+            },
+            'cancellation_analysis': {
+                'by_country': {c: rate for c, _, rate in by_rate},
+                'by_lead_time': {label: lead_times.get(label, float('nan')) for label in LEAD_LABELS}
+            },
+            'top_countries': {c: n for c, n, _ in by_count},
+            'guest_distribution': dict(sorted(guests.items()))
+        }
+
+
+BACKENDS = {
+    PandasBackend.name: PandasBackend,
+    DuckDBBackend.name: DuckDBBackend
+}
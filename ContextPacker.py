@@ -0,0 +1,84 @@
+from langchain.schema import Document
+from typing import List, Tuple, Any, Optional
+import os
+
+
+class ContextPacker:
+    def __init__(self, tokenizer: Any = None, tokenizer_name: Optional[str] = None,
+                 max_tokens: int = 1024, max_k: int = 8, min_k: int = 1,
+                 score_gap: float = 0.25):
+        """Pack retrieved documents into a token-budgeted context.
+
+        `tokenizer` is the target model's tokenizer (anything exposing
+        `encode`); if omitted, `tokenizer_name` is loaded from the Hugging
+        Face Hub on first use. Scores are FAISS L2 distances, so lower is better.
+        """
+        self._tokenizer = tokenizer
+        self.tokenizer_name = tokenizer_name
+        self.max_tokens = max_tokens
+        self.max_k = max_k
+        self.min_k = min_k
+        self.score_gap = score_gap
+
+    @property
+    def tokenizer(self) -> Any:
+        if self._tokenizer is None:
+            from transformers import AutoTokenizer
+            self._tokenizer = AutoTokenizer.from_pretrained(
+                self.tokenizer_name,
+                token=os.environ.get("HUGGINGFACEHUB_API_TOKEN")
+            )
+        return self._tokenizer
+
+    def count_tokens(self, text: str) -> int:
+        """Count tokens as the target model sees them"""
+        return len(self.tokenizer.encode(text, add_special_tokens=False))
+
+    def pack(self, docs_and_scores: List[Tuple[Document, float]],
+             max_tokens: int = None) -> Tuple[List[Document], int]:
+        """Select, deduplicate and trim documents to fit the token budget"""
+        budget = self.max_tokens if max_tokens is None else max_tokens
+        ranked = self._adaptive_k(sorted(docs_and_scores, key=lambda pair: pair[1]))
+
+        packed = []
+        used = 0
+        seen_lines = set()
+        for doc, score in ranked:
+            # Documents are kept whole: drop one only when every line of it
+            # is already in the context, never strip lines from under its header
+            doc_lines = {self._normalize(line) for line in doc.page_content.splitlines()} - {""}
+            if not doc_lines or doc_lines <= seen_lines:
+                continue
+
+            # Separator used by the stuff chain between documents
+            separator = self.count_tokens("\n\n") if packed else 0
+            lines = doc.page_content.splitlines()
+            tokens = self.count_tokens(doc.page_content)
+            while lines and used + separator + tokens > budget:
+                lines.pop()
+                tokens = self.count_tokens("\n".join(lines))
+            # A header with none of its data lines is not worth the tokens
+            if not lines or (len(lines) == 1 and len(doc_lines) > 1):
+                continue
+
+            content = "\n".join(lines)
+            seen_lines.update(self._normalize(line) for line in lines)
+            packed.append(Document(
+                page_content=content,
+                metadata={**doc.metadata, "score": float(score)}
+            ))
+            used += separator + tokens
+
+        return packed, used
+
+    @staticmethod
+    def _normalize(line: str) -> str:
+        return line.strip().lower()
+
+    def _adaptive_k(self, ranked: List[Tuple[Document, float]]) -> List[Tuple[Document, float]]:
+        """Keep documents until the distance to the next one jumps by more than score_gap"""
+        ranked = ranked[:self.max_k]
+        for i in range(max(self.min_k, 1), len(ranked)):
+            if ranked[i][1] - ranked[i - 1][1] > self.score_gap:
+                return ranked[:i]
+        return ranked
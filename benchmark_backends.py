@@ -0,0 +1,119 @@
+"""Time and peak memory of the analytics backends at 1x, 10x and 100x data.
+
+Builds scaled copies of the bookings CSV (and a Parquet copy for DuckDB) in
+a scratch directory, checks every backend against the pandas reference at
+1x, then runs each backend/scale in a fresh process so peak RSS is
+measured per run.
+
+Run: python benchmark_backends.py [--data hotel_bookings.csv] [--scales 1 10 100]
+"""
+from HotelBookingPipeline import HotelBookingPipeline
+from AnalyticsBackend import BACKENDS, DuckDBBackend
+import argparse
+import json
+import math
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def scale_csv(data_path: str, factor: int, out_dir: str) -> str:
+    """Write `factor` copies of the CSV rows under a single header"""
+    out_path = os.path.join(out_dir, f"bookings_{factor}x.csv")
+    with open(data_path) as src:
+        header = src.readline()
+        body = src.read()
+    if not body.endswith("\n"):
+        body += "\n"
+    with open(out_path, "w") as dst:
+        dst.write(header)
+        for _ in range(factor):
+            dst.write(body)
+    return out_path
+
+
+def to_parquet(csv_path: str) -> str:
+    import duckdb
+
+    parquet_path = os.path.splitext(csv_path)[0] + ".parquet"
+    source = DuckDBBackend(csv_path, [])._source()
+    duckdb.connect().execute(f"COPY (SELECT * FROM {source}) TO '{parquet_path}' (FORMAT PARQUET)")
+    return parquet_path
+
+
+def results_match(expected, actual) -> bool:
+    if isinstance(expected, dict):
+        return (list(expected) == list(actual)
+                and all(results_match(expected[k], actual[k]) for k in expected))
+    if math.isnan(expected):
+        return math.isnan(actual)
+    return math.isclose(expected, actual, rel_tol=1e-9)
+
+
+def worker(backend: str, data_path: str) -> None:
+    """Run one backend and print elapsed seconds and peak RSS as JSON"""
+    start = time.perf_counter()
+    HotelBookingPipeline(data_path, backend=backend).compute_analytics()
+    elapsed = time.perf_counter() - start
+    print(json.dumps({"seconds": elapsed, "peak_mb": peak_rss_mb()}))
+
+
+def peak_rss_mb() -> float:
+    """Peak RSS of this process; ru_maxrss alone keeps the parent's high-water mark across exec"""
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / divisor
+
+
+def measure(backend: str, data_path: str) -> str:
+    proc = subprocess.run(
+        [sys.executable, __file__, "--worker", backend, data_path],
+        capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        return f"{'failed':>10} {'':>10}"
+    stats = json.loads(proc.stdout.strip().splitlines()[-1])
+    return f"{stats['seconds']:>10.2f} {stats['peak_mb']:>10.0f}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data", default="hotel_bookings.csv")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--worker", nargs=2, metavar=("BACKEND", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        worker(*args.worker)
+        return
+
+    reference = HotelBookingPipeline(args.data).compute_analytics()
+    for backend in BACKENDS:
+        matches = results_match(reference, HotelBookingPipeline(args.data, backend=backend).compute_analytics())
+        print(f"{backend}: {'matches' if matches else 'DIFFERS FROM'} pandas reference")
+        if not matches:
+            sys.exit(1)
+
+    print(f"\n{'backend':<16} {'scale':>6} {'seconds':>10} {'peak MB':>10}")
+    with tempfile.TemporaryDirectory() as out_dir:
+        for factor in args.scales:
+            csv_path = scale_csv(args.data, factor, out_dir)
+            runs = [(backend, csv_path) for backend in BACKENDS]
+            runs.append((DuckDBBackend.name, to_parquet(csv_path)))
+            for backend, path in runs:
+                label = backend if path.endswith(".csv") else f"{backend} parquet"
+                print(f"{label:<16} {factor:>5}x {measure(backend, path)}")
+
+
+if __name__ == "__main__":
+    main()
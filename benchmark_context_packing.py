@@ -0,0 +1,169 @@
+"""Latency vs answer quality of the RAG context packer on a fixed question set.
+
+Runs every question under several prompt token budgets and against the old
+behaviour (plain similarity_search with k=3 stuffed into the prompt), and
+reports mean prompt tokens, mean latency and the fraction of answers
+containing the expected fact.
+
+The default stub LLM answers with the context document that best overlaps the
+question and sleeps per prompt token to model prefill cost, so the numbers
+reflect what the packer feeds the model. Pass --local-model to use a local
+Hugging Face model instead.
+
+--offline swaps the Mistral tokenizer and MiniLM embeddings for a word-level
+tokenizer and hashed bag-of-words embeddings, and builds the vector store in
+a scratch directory, so the benchmark runs without access to the Hub.
+
+Run: python benchmark_context_packing.py [--data hotel_bookings.csv] [--local-model gpt2] [--offline]
+"""
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models.llms import LLM
+from HotelBookingPipeline import HotelBookingPipeline
+from HotelBookingRAG import HotelBookingRAG, LLM_REPO_ID
+from ContextPacker import ContextPacker
+from typing import Callable, List, Optional, Any, Tuple
+import argparse
+import hashlib
+import math
+import os
+import re
+import tempfile
+import time
+
+QUESTIONS = [
+    ("What is the overall cancellation rate?", "Cancellation rate"),
+    ("How many total bookings are there?", "Total bookings"),
+    ("What is the average lead time?", "Average lead time"),
+    ("What was the average daily rate in August?", "Month: August"),
+    ("How much revenue did July generate?", "Month: July"),
+    ("Which country has the highest cancellation rate?", "Top Cancellation Rates by Country"),
+    ("How does lead time affect cancellations?", "Cancellation Rates by Lead Time"),
+    ("What is the cancellation rate for bookings made 0-7 days ahead?", "0-7d"),
+]
+
+BUDGETS = [128, 256, 512, 1024]
+
+WORD = re.compile(r"\w+|[^\w\s]")
+
+
+class StubLLM(LLM):
+    """Deterministic LLM that echoes the best-matching context document"""
+    prefill_seconds_per_token: float = 0.0005
+    tokenizer: Any = None
+
+    @property
+    def _llm_type(self) -> str:
+        return "stub"
+
+    def _call(self, prompt: str, stop: Optional[List[str]] = None, **kwargs: Any) -> str:
+        time.sleep(len(self.tokenizer.encode(prompt)) * self.prefill_seconds_per_token)
+        context = prompt.split("Context:", 1)[-1].split("Question:", 1)[0]
+        question = prompt.split("Question:", 1)[-1].split("Answer:", 1)[0]
+        words = set(re.findall(r"\w+", question.lower()))
+        documents = [doc for doc in context.split("\n\n") if doc.strip()]
+        if not documents:
+            return "I don't know."
+        return max(documents, key=lambda doc: len(words & set(re.findall(r"\w+", doc.lower()))))
+
+
+class WordTokenizer:
+    """Offline stand-in for the model tokenizer: one token per word or symbol"""
+
+    def encode(self, text: str, add_special_tokens: bool = True) -> List[str]:
+        return WORD.findall(text)
+
+
+class HashedBagOfWordsEmbeddings(Embeddings):
+    """Offline stand-in for MiniLM: L2-normalised hashed word counts"""
+
+    def __init__(self, dim: int = 384):
+        self.dim = dim
+
+    def _embed(self, text: str) -> List[float]:
+        vector = [0.0] * self.dim
+        for word in re.findall(r"\w+", text.lower()):
+            vector[int(hashlib.md5(word.encode()).hexdigest(), 16) % self.dim] += 1.0
+        norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+        return [v / norm for v in vector]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed(text)
+
+
+def packed_answer(rag: HotelBookingRAG) -> Callable[[str], Tuple[str, int]]:
+    def answer(question: str) -> Tuple[str, int]:
+        result = rag.query(question)
+        return result["answer"], result["prompt_tokens"]
+    return answer
+
+
+def fixed_k_answer(rag: HotelBookingRAG, k: int = 3) -> Callable[[str], Tuple[str, int]]:
+    """Previous behaviour: top-k documents stuffed as-is, no dedup or budget"""
+    def answer(question: str) -> Tuple[str, int]:
+        documents = rag.vector_db.similarity_search(question, k=k)
+        prompt = rag.prompt_template.format(
+            context="\n\n".join(doc.page_content for doc in documents),
+            question=question
+        )
+        result = rag.qa_chain({"input_documents": documents, "question": question})
+        return result["output_text"].strip(), rag.context_packer.count_tokens(prompt)
+    return answer
+
+
+def run(answer: Callable[[str], Tuple[str, int]], label: str) -> None:
+    prompt_tokens, latencies, hits = [], [], 0
+    for question, expected in QUESTIONS:
+        start = time.perf_counter()
+        text, tokens = answer(question)
+        latencies.append(time.perf_counter() - start)
+        prompt_tokens.append(tokens)
+        if expected.lower() in text.lower():
+            hits += 1
+
+    n = len(QUESTIONS)
+    print(f"{label:<16} {sum(prompt_tokens) / n:>12.0f} {1000 * sum(latencies) / n:>12.1f} {hits / n:>10.0%}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data", default="hotel_bookings.csv")
+    parser.add_argument("--local-model", help="Hugging Face model id to run locally instead of the stub")
+    parser.add_argument("--offline", action="store_true", help="Use stand-in tokenizer and embeddings")
+    args = parser.parse_args()
+
+    analytics = HotelBookingPipeline(os.path.abspath(args.data)).compute_analytics()
+
+    embedding_model = None
+    if args.offline:
+        tokenizer = WordTokenizer()
+        embedding_model = HashedBagOfWordsEmbeddings()
+        # Keep the stand-in index away from the real vectorstore/ directory
+        os.chdir(tempfile.mkdtemp())
+    elif args.local_model:
+        tokenizer = ContextPacker(tokenizer_name=args.local_model).tokenizer
+    else:
+        tokenizer = ContextPacker(tokenizer_name=LLM_REPO_ID).tokenizer
+
+    if args.local_model:
+        from langchain_community.llms import HuggingFacePipeline
+        llm = HuggingFacePipeline.from_model_id(
+            model_id=args.local_model,
+            task="text-generation",
+            pipeline_kwargs={"max_new_tokens": 64}
+        )
+    else:
+        llm = StubLLM(tokenizer=tokenizer)
+    rag = HotelBookingRAG(analytics, llm=llm, tokenizer=tokenizer, embedding_model=embedding_model)
+
+    print(f"{'config':<16} {'prompt tok':>12} {'latency ms':>12} {'quality':>10}")
+    run(fixed_k_answer(rag), "fixed k=3")
+    for budget in BUDGETS:
+        rag.max_prompt_tokens = budget
+        run(packed_answer(rag), f"budget={budget}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+import math
+
+import duckdb
+import pytest
+
+from AnalyticsBackend import PandasBackend, DuckDBBackend, LEAD_LABELS
+from HotelBookingPipeline import HotelBookingPipeline
+
+HEADER = (
+    "hotel,is_canceled,lead_time,arrival_date_year,arrival_date_month,"
+    "arrival_date_day_of_month,stays_in_weekend_nights,stays_in_week_nights,"
+    "adults,children,meal,country,agent,company,adr,reservation_status_date"
+)
+
+ROWS = [
+    # Three PRT bookings, two canceled
+    "Resort Hotel,1,5,2015,July,1,1,2,2,0,BB,PRT,9,NULL,100.0,2015-07-01",
+    "Resort Hotel,1,20,2015,July,2,0,3,2,1,HB,PRT,9,NULL,120.5,2015-07-02",
+    "Resort Hotel,0,60,2015,August,3,2,1,1,0,SC,PRT,NULL,NULL,80.25,2015-08-03",
+    # GBR/FRA/ESP tie on rate (0.5) and count (2)
+    "City Hotel,1,100,2016,August,4,1,1,2,0,BB,GBR,9,NULL,90.0,2016-08-04",
+    "City Hotel,0,200,2016,March,5,0,2,2,0,BB,GBR,9,NULL,95.0,2016-03-05",
+    "City Hotel,0,300,2016,March,6,1,0,1,1,FB,FRA,9,NULL,70.0,2016-03-06",
+    "City Hotel,1,400,2016,January,7,2,2,2,2,BB,FRA,9,NULL,150.0,2016-01-07",
+    "City Hotel,1,500,2017,January,8,0,1,3,0,Undefined,ESP,9,NULL,60.0,2017-01-08",
+    "City Hotel,0,700,2017,December,9,1,1,2,0,BB,ESP,9,NULL,110.0,2017-12-09",
+    # Single bookings: rate and count ties across the top-10 cut
+    "City Hotel,1,10,2017,December,10,1,1,2,0,BB,DEU,9,NULL,55.0,2017-12-10",
+    "City Hotel,1,15,2017,May,11,0,2,2,0,BB,ITA,9,NULL,65.0,2017-05-11",
+    "City Hotel,0,25,2017,May,12,1,2,2,0,BB,IRL,9,NULL,75.0,2017-05-12",
+    "City Hotel,0,35,2017,June,13,2,0,2,0,BB,BEL,9,NULL,85.0,2017-06-13",
+    "City Hotel,0,45,2017,June,14,0,1,2,0,BB,BRA,9,NULL,95.0,2017-06-14",
+    "City Hotel,0,55,2017,June,15,1,1,2,0,BB,NLD,9,NULL,105.0,2017-06-15",
+    "City Hotel,0,65,2017,April,16,0,2,2,0,BB,AGO,9,NULL,115.0,2017-04-16",
+    "City Hotel,0,75,2017,April,17,1,0,2,0,BB,CHE,9,NULL,125.0,2017-04-17",
+    # NULL country becomes Unknown
+    "City Hotel,1,85,2017,April,18,1,1,2,0,BB,NULL,9,NULL,135.0,2017-04-18",
+    # lead_time 0 and > 737 fall outside every lead time bin
+    "City Hotel,1,0,2016,July,19,0,1,2,0,BB,PRT,9,NULL,99.0,2016-07-19",
+    "City Hotel,0,800,2016,July,20,1,1,2,0,BB,GBR,9,NULL,101.0,2016-07-20",
+    # Dropped: NA children, and no guests
+    "City Hotel,1,30,2016,July,21,1,1,2,NA,BB,PRT,9,NULL,500.0,2016-07-21",
+    "City Hotel,1,30,2016,July,22,1,1,0,0,BB,PRT,9,NULL,500.0,2016-07-22",
+]
+
+
+@pytest.fixture
+def bookings_csv(tmp_path):
+    path = tmp_path / "bookings.csv"
+    path.write_text("\n".join([HEADER] + ROWS) + "\n")
+    return str(path)
+
+
+@pytest.fixture
+def bookings_parquet(bookings_csv):
+    path = bookings_csv.replace(".csv", ".parquet")
+    source = DuckDBBackend(bookings_csv, [])._source()
+    duckdb.connect().execute(f"COPY (SELECT * FROM {source}) TO '{path}' (FORMAT PARQUET)")
+    return path
+
+
+@pytest.fixture
+def month_order():
+    return [
+        'January', 'February', 'March', 'April', 'May', 'June',
+        'July', 'August', 'September', 'October', 'November', 'December'
+    ]
+
+
+def assert_same(expected, actual, path="analytics"):
+    if isinstance(expected, dict):
+        assert list(expected) == list(actual), path
+        for key in expected:
+            assert_same(expected[key], actual[key], f"{path}[{key!r}]")
+    elif isinstance(expected, float) and math.isnan(expected):
+        assert math.isnan(actual), path
+    else:
+        assert actual == pytest.approx(expected, rel=1e-12), path
+
+
+def test_pandas_reference_semantics(bookings_csv, month_order):
+    analytics = PandasBackend(bookings_csv, month_order).compute()
+
+    assert analytics['summary_stats']['total_bookings'] == len(ROWS) - 2
+    # Ties break by country name, so the top-10 cut is deterministic
+    assert list(analytics['cancellation_analysis']['by_country'])[:4] == ['DEU', 'ITA', 'Unknown', 'PRT']
+    assert list(analytics['top_countries']) == [
+        'PRT', 'GBR', 'ESP', 'FRA', 'AGO', 'BEL', 'BRA', 'CHE', 'DEU', 'IRL'
+    ]
+    assert list(analytics['cancellation_analysis']['by_lead_time']) == LEAD_LABELS
+    assert sum(analytics['guest_distribution'].values()) == len(ROWS) - 2
+
+
+@pytest.mark.parametrize("source", ["bookings_csv", "bookings_parquet"])
+def test_duckdb_matches_pandas(request, source, bookings_csv, month_order):
+    expected = PandasBackend(bookings_csv, month_order).compute()
+    actual = DuckDBBackend(request.getfixturevalue(source), month_order, threads=2).compute()
+    assert_same(expected, actual)
+
+
+def test_pandas_reads_parquet(bookings_csv, bookings_parquet, month_order):
+    assert_same(
+        PandasBackend(bookings_csv, month_order).compute(),
+        PandasBackend(bookings_parquet, month_order).compute()
+    )
+
+
+def test_duckdb_skips_null_months(tmp_path, month_order):
+    path = tmp_path / "null_month.csv"
+    path.write_text("\n".join([HEADER, ROWS[0], ROWS[2].replace("August", "NULL")]) + "\n")
+    monthly = DuckDBBackend(str(path), month_order).compute()['monthly_metrics']
+    assert list(monthly['monthly_adr']) == ['July']
+    assert list(monthly['monthly_revenue']) == ['July']
+
+
+def test_pipeline_uses_configured_backend(bookings_csv):
+    pandas_pipeline = HotelBookingPipeline(bookings_csv)
+    duckdb_pipeline = HotelBookingPipeline(bookings_csv, backend="duckdb", memory_limit="1GB")
+    assert_same(pandas_pipeline.compute_analytics(), duckdb_pipeline.compute_analytics())
+    assert pandas_pipeline.raw_data is not None
+    assert duckdb_pipeline.raw_data is None
+
+    with pytest.raises(ValueError):
+        HotelBookingPipeline(bookings_csv, backend="spark")
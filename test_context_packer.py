@@ -0,0 +1,55 @@
+from langchain.schema import Document
+
+from ContextPacker import ContextPacker
+
+
+class WordTokenizer:
+    def encode(self, text, add_special_tokens=True):
+        return text.split()
+
+
+def month_doc(month, adr="$100.00", revenue="$0"):
+    return Document(
+        page_content=f"Month: {month}\n- Average Daily Rate: {adr}\n- Total Revenue: {revenue}",
+        metadata={"category": "monthly", "month": month}
+    )
+
+
+def test_shared_data_lines_are_kept_under_each_header():
+    packer = ContextPacker(tokenizer=WordTokenizer(), score_gap=10)
+    july, august = month_doc("July"), month_doc("August")
+
+    packed, _ = packer.pack([(july, 0.1), (august, 0.2)])
+
+    assert [doc.page_content for doc in packed] == [july.page_content, august.page_content]
+
+
+def test_fully_repeated_document_is_dropped():
+    packer = ContextPacker(tokenizer=WordTokenizer(), score_gap=10)
+    summary = Document(page_content="Booking Summary:\n- Total bookings: 10", metadata={})
+    repeat = Document(page_content="booking summary:\n  - Total bookings: 10", metadata={})
+
+    packed, _ = packer.pack([(summary, 0.1), (repeat, 0.2), (month_doc("July"), 0.3)])
+
+    assert [doc.page_content for doc in packed] == [summary.page_content, month_doc("July").page_content]
+
+
+def test_budget_trims_lines_and_skips_bare_headers():
+    packer = ContextPacker(tokenizer=WordTokenizer(), score_gap=10)
+    july, august = month_doc("July"), month_doc("August")
+
+    # July (11 words) fits; August only has room for its header, so it is skipped
+    packed, used = packer.pack([(july, 0.1), (august, 0.2)], max_tokens=14)
+
+    assert [doc.metadata["month"] for doc in packed] == ["July"]
+    assert used == 11
+
+
+def test_adaptive_k_stops_at_score_gap():
+    packer = ContextPacker(tokenizer=WordTokenizer(), score_gap=0.25)
+    docs = [(month_doc(m), score) for m, score in [("July", 0.1), ("August", 0.2), ("May", 0.9)]]
+
+    packed, _ = packer.pack(docs)
+
+    assert [doc.metadata["month"] for doc in packed] == ["July", "August"]
+    assert packed[0].metadata["score"] == 0.1